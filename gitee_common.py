@@ -0,0 +1,35 @@
+from datetime import datetime
+import re
+
+# Repository URL patterns, compiled once at import
+_SSH_RE = re.compile(r'^git@gitee\.com:([^/]+)/([^/]+?)(\.git)?$')
+_HTTPS_RE = re.compile(r'^(https?://|git://)?gitee\.com/([^/]+)/([^/]+?)(\.git)?$')
+
+
+def parse_repo_url(repo_url: str) -> tuple[str, str]:
+    """Extract owner and repo from any format of Gitee URL."""
+    # Remove leading/trailing whitespace and slashes
+    url = repo_url.strip().strip('/')
+    
+    # Case 1: Simple format (owner/repo)
+    if '/' in url and not any(x in url for x in [':', '@', 'gitee.com']):
+        parts = url.split('/')
+        if len(parts) >= 2:
+            return parts[0], parts[1]
+    
+    # Case 2: SSH format (git@gitee.com:owner/repo.git)
+    ssh_match = _SSH_RE.match(url)
+    if ssh_match:
+        return ssh_match.group(1), ssh_match.group(2)
+    
+    # Case 3: HTTPS or git protocol (https://gitee.com/owner/repo or git://gitee.com/owner/repo)
+    https_match = _HTTPS_RE.match(url)
+    if https_match:
+        return https_match.group(2), https_match.group(3)
+        
+    raise ValueError("Invalid repository URL format. Supported formats: owner/repo, https://gitee.com/owner/repo, git@gitee.com:owner/repo")
+
+
+def get_target_dir(now: datetime) -> str:
+    """Generate target directory path based on the given date."""
+    return f"images/{now.year}/{now.month:02d}/{now.day:02d}"
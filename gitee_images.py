@@ -5,15 +5,228 @@ except ImportError:
     from stub import Node, register_node
 
 import os
+import atexit
+import json
 import base64
+import hashlib
+import random
+import socket
 import asyncio
 import aiohttp
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, AsyncGenerator, Callable, List, Optional, Tuple
 from datetime import datetime
-import re
+from urllib.parse import quote
+
+try:
+    from .gitee_common import parse_repo_url, get_target_dir
+except ImportError:
+    from gitee_common import parse_repo_url, get_target_dir
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ACCESS_TOKEN = get_api_key(provider="gitee.com", key_name="ACCESS_TOKEN")
 
+# Statuses that signal a transient failure worth retrying
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class _NoDelayConnector(aiohttp.TCPConnector):
+    """TCPConnector that forces TCP_NODELAY on every new connection."""
+
+    async def _wrap_create_connection(self, *args, **kwargs):
+        transport, protocol = await super()._wrap_create_connection(*args, **kwargs)
+        # Avoid Nagle + delayed-ACK stalls between the request header and body writes
+        sock = transport.get_extra_info("socket")
+        if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return transport, protocol
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _ApiError(ValueError):
+    """Raised for a non-retryable error response from the Gitee API."""
+
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status = status
+
+
+class _RetryableError(Exception):
+    """Raised for a response whose status is worth retrying."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _LocalFileError(OSError):
+    """Raised when an image file cannot be read while its body is being streamed."""
+
+
+def _find_local_file_error(exc: Optional[BaseException]) -> Optional[_LocalFileError]:
+    """Find a _LocalFileError in the cause chain of exc.
+
+    aiohttp wraps errors raised by a streamed body in its own client errors, so a
+    local read failure has to be dug out to keep it from being retried.
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        if isinstance(exc, _LocalFileError):
+            return exc
+        seen.add(id(exc))
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+# Failures an upload can run into: network, retries exhausted, file I/O and bad responses
+_UPLOAD_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, _RetryableError, OSError, ValueError)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds; HTTP dates are ignored."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+async def _iter_file_chunks(path: str, chunk_size: int) -> AsyncGenerator[bytes, None]:
+    """Read a file in chunks without blocking the event loop."""
+    if aiofiles is not None:
+        async with aiofiles.open(path, "rb") as f:
+            while True:
+                block = await f.read(chunk_size)
+                if not block:
+                    break
+                yield block
+        return
+
+    # Without aiofiles, run each blocking call in the default executor
+    f = await asyncio.to_thread(open, path, "rb")
+    try:
+        while True:
+            block = await asyncio.to_thread(f.read, chunk_size)
+            if not block:
+                break
+            yield block
+    finally:
+        f.close()
+
+
+def _check_readable(path: str) -> Optional[OSError]:
+    """Return an error if path is not a readable regular file, otherwise None."""
+    if not os.path.isfile(path):
+        return FileNotFoundError(f"Image file not found: {path}")
+    if not os.access(path, os.R_OK):
+        return PermissionError(f"Image file is not readable: {path}")
+    return None
+
+
+async def _git_blob_sha(path: str, chunk_size: int = 1 << 16) -> str:
+    """Return the git blob SHA-1 of a file, the "sha" the contents API reports."""
+    h = hashlib.sha1(f"blob {os.path.getsize(path)}\0".encode('ascii'))
+    async for block in _iter_file_chunks(path, chunk_size):
+        h.update(block)
+    return h.hexdigest()
+
+
+async def _file_sha256(path: str, chunk_size: int = 1 << 16) -> str:
+    """Return the hex SHA-256 of a file, hashed in chunks."""
+    h = hashlib.sha256()
+    async for block in _iter_file_chunks(path, chunk_size):
+        h.update(block)
+    return h.hexdigest()
+
+
+# Shared HTTP session so TCP/TLS connections to gitee.com survive across executions.
+# A session is bound to one event loop, so connections are only reused while the
+# host keeps running on the same loop; a host that calls asyncio.run per execution
+# gets a fresh session each time, closed again when that loop shuts down.
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SESSION_WATCHER: Optional[asyncio.Task] = None
+
+
+async def _close_on_loop_shutdown(session: aiohttp.ClientSession) -> None:
+    """Keep the session open until its loop cancels this task on shutdown, then close it."""
+    try:
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await session.close()
+
+
+async def _release_session(session: aiohttp.ClientSession) -> None:
+    """Drop a session whose loop went away without cancelling its watcher task."""
+    if session.closed:
+        return
+    # detach() marks the session closed without touching the connector, which is
+    # then closed through its public API from whatever loop is running now
+    connector = session.connector
+    session.detach()
+    if connector is not None and not connector.closed:
+        try:
+            await connector.close()
+        except RuntimeError:
+            # Transports of a closed loop cannot schedule their own teardown; the
+            # connector is still marked closed and their sockets go with the loop
+            pass
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use."""
+    global _SESSION, _SESSION_LOOP, _SESSION_WATCHER
+    loop = asyncio.get_running_loop()
+    if _SESSION is not None and not _SESSION.closed and _SESSION_LOOP is loop:
+        return _SESSION
+
+    # The old loop can no longer run coroutines, so release its connections directly
+    if _SESSION is not None and _SESSION_LOOP is not loop:
+        await _release_session(_SESSION)
+
+    connector = _NoDelayConnector(limit=16, limit_per_host=8, keepalive_timeout=75, ttl_dns_cache=300)
+    _SESSION = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=120))
+    _SESSION_LOOP = loop
+    _SESSION_WATCHER = loop.create_task(_close_on_loop_shutdown(_SESSION))
+    return _SESSION
+
+
+def _close_session() -> None:
+    """Close the shared session on interpreter shutdown."""
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is None:
+        return
+    if not _SESSION_LOOP.is_closed() and not _SESSION_LOOP.is_running():
+        # Cancelling the watcher closes the session from inside its own loop
+        _SESSION_WATCHER.cancel()
+        _SESSION_LOOP.run_until_complete(asyncio.gather(_SESSION_WATCHER, return_exceptions=True))
+    elif _SESSION_LOOP.is_closed():
+        asyncio.run(_release_session(_SESSION))
+
+
+atexit.register(_close_session)
+
 @register_node
 class GiteeImageUploader(Node):
     NAME = "Gitee Image Uploader"
@@ -22,6 +235,17 @@ class GiteeImageUploader(Node):
     MAINTAINER = "AutoTask Team"
     ICON = "📤"
 
+    # Maximum number of uploads in flight at once
+    MAX_CONCURRENCY = 8
+    # Files at least this large are base64-encoded off the event loop thread
+    ENCODE_OFFLOAD_THRESHOLD = 2 * 1024 * 1024
+    # Block size used when offloading: ~2 ms of encoding per ~40 us thread hop
+    ENCODE_OFFLOAD_CHUNK = 3 * 512 * 1024
+    # Retries after the first attempt for 429/5xx responses and network errors
+    MAX_RETRIES = 4
+    # Upper bound in seconds for a single backoff sleep
+    MAX_BACKOFF = 30
+
     INPUTS = {
         "img1": {
             "label": "Image 1",
@@ -168,34 +392,6 @@ class GiteeImageUploader(Node):
         }
     }
 
-    def _parse_repo_url(self, repo_url: str) -> tuple[str, str]:
-        """Extract owner and repo from any format of Gitee URL."""
-        # Remove leading/trailing whitespace and slashes
-        url = repo_url.strip().strip('/')
-        
-        # Case 1: Simple format (owner/repo)
-        if '/' in url and not any(x in url for x in [':', '@', 'gitee.com']):
-            parts = url.split('/')
-            if len(parts) >= 2:
-                return parts[0], parts[1]
-        
-        # Case 2: SSH format (git@gitee.com:owner/repo.git)
-        ssh_match = re.match(r'^git@gitee\.com:([^/]+)/([^/]+?)(\.git)?$', url)
-        if ssh_match:
-            return ssh_match.group(1), ssh_match.group(2)
-        
-        # Case 3: HTTPS or git protocol (https://gitee.com/owner/repo or git://gitee.com/owner/repo)
-        https_match = re.match(r'^(https?://|git://)?gitee\.com/([^/]+)/([^/]+?)(\.git)?$', url)
-        if https_match:
-            return https_match.group(2), https_match.group(3)
-            
-        raise ValueError("Invalid repository URL format. Supported formats: owner/repo, https://gitee.com/owner/repo, git@gitee.com:owner/repo")
-
-    def _get_target_dir(self) -> str:
-        """Generate target directory path based on current date."""
-        now = datetime.now()
-        return f"images/{now.year}/{now.month:02d}/{now.day:02d}"
-
     def _get_valid_image_paths(self, node_inputs: Dict[str, str]) -> List[Tuple[int, str]]:
         """Get all valid image paths from inputs with their indices."""
         valid_images = []
@@ -205,60 +401,254 @@ class GiteeImageUploader(Node):
                 valid_images.append((i, node_inputs[img_key]))
         return valid_images
 
-    def _get_timestamped_filename(self, original_filename: str) -> str:
-        """Add timestamp to filename while preserving extension."""
+    async def _group_by_content(self, image_paths: List[Tuple[int, str]]) -> List[List[Tuple[int, str]]]:
+        """Group image paths whose files have identical content, preserving input order."""
+        async def content_key(image_path: str) -> str:
+            try:
+                return await _file_sha256(image_path)
+            except OSError:
+                # Unreadable files stay on their own so the upload reports the error
+                return f"path:{image_path}"
+
+        keys = await asyncio.gather(*(content_key(path) for _, path in image_paths))
+        groups: Dict[str, List[Tuple[int, str]]] = {}
+        for key, item in zip(keys, image_paths):
+            groups.setdefault(key, []).append(item)
+        return list(groups.values())
+
+    def _get_timestamped_filename(self, original_filename: str, timestamp: str, index: int) -> str:
+        """Add timestamp and input index to filename while preserving extension."""
+        # The index keeps same-named files from one batch apart, since they share the timestamp
         name, ext = os.path.splitext(original_filename)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{name}_{timestamp}{ext}"
+        return f"{name}_{timestamp}_{index}{ext}"
 
-    async def _upload_single_image(self, session: aiohttp.ClientSession, image_path: str, owner: str, repo: str, 
-                                 target_dir: str, index: int, workflow_logger) -> Dict[str, Any]:
-        """Upload a single image to Gitee and return its URL."""
+    async def _b64_stream(self, image_path: str, chunk: int = 3 * 64 * 1024) -> AsyncGenerator[bytes, None]:
+        """Yield the base64 encoding of a file chunk by chunk instead of buffering it whole.
+
+        Reading and encoding run in a producer task, so the next block is read and
+        encoded while the caller is still sending the previous one.
+        """
+        # Two blocks in flight keep the stages overlapped while memory stays flat
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        loop = asyncio.get_running_loop()
+
+        async def produce() -> None:
+            try:
+                # Small files encode inline in short slices (~0.3 ms per default block);
+                # large files go to the executor in bigger blocks so each hop pays off
+                offload = os.path.getsize(image_path) >= self.ENCODE_OFFLOAD_THRESHOLD
+                block_size = self.ENCODE_OFFLOAD_CHUNK if offload else chunk
+                # Block sizes are multiples of 3, so padding only appears on the final read
+                async for block in _iter_file_chunks(image_path, block_size):
+                    if offload:
+                        encoded = await loop.run_in_executor(None, base64.b64encode, block)
+                    else:
+                        encoded = base64.b64encode(block)
+                    await queue.put(encoded)
+            except OSError as e:
+                error = _LocalFileError(f"Cannot read image file {image_path}: {e}")
+                error.__cause__ = e
+                await queue.put(error)
+                return
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
         try:
-            # Read and encode image
-            with open(image_path, "rb") as f:
-                content = f.read()
-            b64_content = base64.b64encode(content).decode('utf-8')
-            
-            # Get original filename and create timestamped version
-            original_filename = os.path.basename(image_path)
-            filename = self._get_timestamped_filename(original_filename)
-            
-            # Prepare API request
-            api_url = f"https://gitee.com/api/v5/repos/{owner}/{repo}/contents/{target_dir}/{filename}"
-            
-            payload = {
-                "access_token": ACCESS_TOKEN,
-                "content": b64_content,
-                "branch": "master",
-                "message": f"Upload image: {filename} (original: {original_filename})"
-            }
-            
-            # Send request using aiohttp session
-            async with session.post(api_url, json=payload) as response:
-                response_text = await response.text()
-                # Accept both 200 (OK) and 201 (Created) status codes
-                if response.status not in [200, 201]:
-                    raise ValueError(f"API request failed with status {response.status}: {response_text}")
-                
-                result = await response.json()
-                if "content" not in result or "download_url" not in result["content"]:
-                    raise ValueError(f"Invalid API response format: {response_text}")
-            
-            workflow_logger.info(f"Successfully uploaded image {index}: {filename}")
-            return {
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    async def _json_body(self, fields: Dict[str, str], image_path: str) -> AsyncGenerator[bytes, None]:
+        """Stream a JSON object made of fields plus the base64 file as "content"."""
+        # Base64 output needs no JSON escaping, so the blocks can be written verbatim
+        yield _json_dumps(fields)[:-1] + b',"content":"'
+        async for block in self._b64_stream(image_path):
+            yield block
+        yield b'"}'
+
+    async def _batch_body(self, fields: Dict[str, str],
+                          files: List[Tuple[int, str, str]]) -> AsyncGenerator[bytes, None]:
+        """Stream a multi-file commit body with one base64 "create" action per file."""
+        yield _json_dumps(fields)[:-1] + b',"actions":['
+        for i, (_, image_path, repo_path) in enumerate(files):
+            action = {"action": "create", "path": repo_path, "encoding": "base64"}
+            yield (b',' if i else b'') + _json_dumps(action)[:-1] + b',"content":"'
+            async for block in self._b64_stream(image_path):
+                yield block
+            yield b'"}'
+        yield b']}'
+
+    def _snippet(self, raw: bytes, limit: int = 512) -> str:
+        """Decode the start of a response body for use in an error message."""
+        return raw[:limit].decode('utf-8', 'replace')
+
+    async def _post_json(self, session: aiohttp.ClientSession, url: str,
+                         make_body: Callable[[], AsyncGenerator[bytes, None]], workflow_logger) -> Any:
+        """POST a streamed JSON body and return the parsed response.
+
+        Network errors, 429 and 5xx responses are retried with exponential backoff
+        plus jitter, honoring Retry-After; every sleep is capped at MAX_BACKOFF.
+        Local file read errors are raised at once. make_body is called once per
+        attempt because a streamed body can only be sent once.
+        """
+        headers = {"Content-Type": "application/json"}
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with session.post(url, data=make_body(), headers=headers) as response:
+                    # Read the body once; it is only decoded to text for error messages
+                    raw = await response.read()
+                    if response.status in _RETRY_STATUSES:
+                        raise _RetryableError(
+                            f"API request failed with status {response.status}: {self._snippet(raw)}",
+                            _parse_retry_after(response.headers.get("Retry-After"))
+                        )
+                    # Accept both 200 (OK) and 201 (Created) status codes
+                    if response.status not in [200, 201]:
+                        raise _ApiError(f"API request failed with status {response.status}: {self._snippet(raw)}",
+                                        response.status)
+
+                    return _json_loads(raw)
+            except (aiohttp.ClientError, asyncio.TimeoutError, _RetryableError) as e:
+                # A file that cannot be read will not become readable by retrying
+                local_error = _find_local_file_error(e)
+                if local_error is not None:
+                    raise local_error from e
+                if attempt == self.MAX_RETRIES:
+                    raise
+                delay = getattr(e, "retry_after", None)
+                if delay is None:
+                    delay = 2 ** attempt + random.random()
+                delay = min(delay, self.MAX_BACKOFF)
+                workflow_logger.info(f"Retrying {url.split('?')[0]} in {delay:.1f}s after error: {e}")
+                await asyncio.sleep(delay)
+
+    async def _find_uploaded(self, session: aiohttp.ClientSession, owner: str, repo: str, repo_path: str,
+                             image_path: str) -> Optional[str]:
+        """Return the download URL if repo_path already holds this image's content.
+
+        Creates are not idempotent: an attempt that timed out or got a 5xx may have
+        landed anyway, and the retry is then rejected because the file exists.
+        """
+        api_url = f"https://gitee.com/api/v5/repos/{owner}/{repo}/contents/{quote(repo_path)}"
+        params = {"ref": "master"}
+        if ACCESS_TOKEN:
+            params["access_token"] = ACCESS_TOKEN
+        try:
+            async with session.get(api_url, params=params) as response:
+                if response.status != 200:
+                    return None
+                info = _json_loads(await response.read())
+            if not isinstance(info, dict) or info.get("sha") != await _git_blob_sha(image_path):
+                return None
+        except _UPLOAD_ERRORS:
+            return None
+        return info.get("download_url")
+
+    def _failed_result(self, index: int, image_path: str, error: Exception, workflow_logger) -> Dict[str, Any]:
+        """Log an upload failure and build its result entry."""
+        error_msg = f"Failed to upload image {index} ({os.path.basename(image_path)}): {str(error)}"
+        workflow_logger.error(error_msg)
+        return {
+            "index": index,
+            "success": False,
+            "error_message": error_msg
+        }
+
+    async def _upload_batch(self, session: aiohttp.ClientSession, images: List[Tuple[int, str]], owner: str,
+                            repo: str, target_dir: str, timestamp: str,
+                            workflow_logger) -> Optional[List[Dict[str, Any]]]:
+        """Upload several readable images as a single commit and return one result per image.
+
+        Returns None when the commit fails for any reason, so the caller can fall
+        back to one contents upload per image and let each succeed or fail alone.
+        """
+        files: List[Tuple[int, str, str]] = []
+        for index, image_path in images:
+            filename = self._get_timestamped_filename(os.path.basename(image_path), timestamp, index)
+            files.append((index, image_path, f"{target_dir}/{filename}"))
+
+        api_url = f"https://gitee.com/api/v5/repos/{owner}/{repo}/commits"
+        fields = {
+            "access_token": ACCESS_TOKEN,
+            "branch": "master",
+            "message": f"Upload {len(files)} images: " + ", ".join(os.path.basename(p) for _, _, p in files)
+        }
+        try:
+            await self._post_json(session, api_url, lambda: self._batch_body(fields, files), workflow_logger)
+        except _UPLOAD_ERRORS as e:
+            workflow_logger.info(f"Multi-file commit failed, uploading images one by one: {e}")
+            return None
+
+        results = []
+        for index, image_path, repo_path in files:
+            workflow_logger.info(f"Successfully uploaded image {index}: {os.path.basename(repo_path)}")
+            results.append({
                 "index": index,
                 "success": True,
-                "url": result["content"]["download_url"]
-            }
-        except Exception as e:
-            error_msg = f"Failed to upload image {index} ({os.path.basename(image_path)}): {str(e)}"
-            workflow_logger.error(error_msg)
-            return {
-                "index": index,
-                "success": False,
-                "error_message": error_msg
-            }
+                "url": f"https://gitee.com/{owner}/{repo}/raw/master/{quote(repo_path)}"
+            })
+        return results
+
+    async def _upload_single_image(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore, image_path: str,
+                                 owner: str, repo: str, target_dir: str, timestamp: str, index: int,
+                                 workflow_logger) -> Dict[str, Any]:
+        """Upload a single image to Gitee and return its URL."""
+        # The body is read lazily while sending, so fail fast on a missing file
+        error = _check_readable(image_path)
+        if error is not None:
+            return self._failed_result(index, image_path, error, workflow_logger)
+
+        # Get original filename and create timestamped version
+        original_filename = os.path.basename(image_path)
+        filename = self._get_timestamped_filename(original_filename, timestamp, index)
+        
+        # Prepare API request
+        api_url = f"https://gitee.com/api/v5/repos/{owner}/{repo}/contents/{quote(f'{target_dir}/{filename}')}"
+        
+        fields = {
+            "access_token": ACCESS_TOKEN,
+            "branch": "master",
+            "message": f"Upload image: {filename} (original: {original_filename})"
+        }
+        
+        async with semaphore:
+            # Stream the JSON body so the encoded image is never materialized in memory
+            try:
+                result = await self._post_json(
+                    session, api_url, lambda: self._json_body(fields, image_path), workflow_logger
+                )
+            except _ApiError as e:
+                # The file may exist because an earlier attempt landed before the retry
+                download_url = await self._find_uploaded(
+                    session, owner, repo, f"{target_dir}/{filename}", image_path
+                )
+                if download_url is None:
+                    return self._failed_result(index, image_path, e, workflow_logger)
+                result = {"content": {"download_url": download_url}}
+            except _UPLOAD_ERRORS as e:
+                return self._failed_result(index, image_path, e, workflow_logger)
+
+        try:
+            download_url = result["content"]["download_url"]
+        except (KeyError, TypeError):
+            error = ValueError(f"Invalid API response format: {result}")
+            return self._failed_result(index, image_path, error, workflow_logger)
+        
+        workflow_logger.info(f"Successfully uploaded image {index}: {filename}")
+        return {
+            "index": index,
+            "success": True,
+            "url": download_url
+        }
 
     async def execute(self, node_inputs: Dict[str, str], workflow_logger) -> Dict[str, Any]:
         try:
@@ -267,8 +657,11 @@ class GiteeImageUploader(Node):
                 raise ValueError("At least one image path must be provided")
 
             repo_url = node_inputs["repo_url"]
-            owner, repo = self._parse_repo_url(repo_url)
-            target_dir = self._get_target_dir()
+            owner, repo = parse_repo_url(repo_url)
+            # One timestamp per batch, shared by the target directory and every filename
+            now = datetime.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
+            target_dir = get_target_dir(now)
             
             workflow_logger.info(f"Uploading {len(image_paths)} images to Gitee repository: {owner}/{repo}")
             workflow_logger.info(f"Target directory: {target_dir}")
@@ -277,18 +670,47 @@ class GiteeImageUploader(Node):
             results = {f"url{i}": "" for i in range(1, 9)}
             results.update({"success": True, "error_message": ""})
 
-            # Create aiohttp session for connection pooling
-            async with aiohttp.ClientSession() as session:
-                # Upload images sequentially
-                for index, image_path in image_paths:
-                    result = await self._upload_single_image(session, image_path, owner, repo, target_dir, index, workflow_logger)
-                    
-                    if result["success"]:
-                        results[f"url{result['index']}"] = result["url"]
-                    else:
-                        results["success"] = False
-                        results["error_message"] = result["error_message"]
-                        break
+            # Reuse the shared session so warm connections are kept between runs
+            session = await _get_session()
+
+            # Identical files are uploaded once and their URL shared
+            groups = await self._group_by_content(image_paths)
+            if len(groups) < len(image_paths):
+                workflow_logger.info(f"Skipping {len(image_paths) - len(groups)} duplicate images")
+
+            representatives = [group[0] for group in groups]
+
+            # Several readable images go in one commit; unreadable ones are left to the
+            # per-image path so they cannot sink the commit for the others
+            results_by_index: Dict[int, Dict[str, Any]] = {}
+            batchable = [item for item in representatives if _check_readable(item[1]) is None]
+            if len(batchable) > 1:
+                batch_results = await self._upload_batch(session, batchable, owner, repo, target_dir,
+                                                          timestamp, workflow_logger)
+                for result in batch_results or []:
+                    results_by_index[result["index"]] = result
+
+            # Upload the rest one image per group concurrently, bounded by the semaphore
+            semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+            tasks = [
+                self._upload_single_image(session, semaphore, image_path, owner, repo, target_dir, timestamp,
+                                          index, workflow_logger)
+                for index, image_path in representatives
+                if index not in results_by_index
+            ]
+            for result in await asyncio.gather(*tasks, return_exceptions=False):
+                results_by_index[result["index"]] = result
+            results_list = [results_by_index[index] for index, _ in representatives]
+
+            errors = []
+            for group, result in zip(groups, results_list):
+                if result["success"]:
+                    for index, _ in group:
+                        results[f"url{index}"] = result["url"]
+                else:
+                    results["success"] = False
+                    errors.append(result["error_message"])
+            results["error_message"] = "; ".join(errors)
 
             if results["success"]:
                 workflow_logger.info("All images uploaded successfully")
@@ -4,11 +4,31 @@ except ImportError:
     from stub import Node, register_node
 
 import os
+import atexit
 import asyncio
-from typing import Dict, Any, List, Tuple
-from playwright.async_api import async_playwright, Browser, Page
+import logging
+import threading
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
+from playwright.async_api import async_playwright, Browser, Page, Playwright, Route
 import re
 
+logger = logging.getLogger(__name__)
+
+# Direct image links as shown in the "code_direct" embed box
+_POSTIMG_RE = re.compile(r'https://i\.postimg\.cc/\w+/\S+')
+
+# Resource types the upload flow never needs; aborting them speeds up navigation
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _block_resources(route: Route) -> None:
+    """Abort requests for non-essential resources, let everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
 @register_node
 class PostImageUploader(Node):
     NAME = "PostImage Uploader"
@@ -17,6 +37,16 @@ class PostImageUploader(Node):
     MAINTAINER = "AutoTask Team"
     ICON = "📤"
 
+    # Browser kept alive across executions; only the context is created per run.
+    # Playwright objects are bound to one event loop, so the browser is only reused
+    # while the host stays on the same loop; under asyncio.run per execution each
+    # run launches its own browser, which is closed again when that loop shuts down.
+    _playwright: Optional[Playwright] = None
+    _browser: Optional[Browser] = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _watcher: Optional[asyncio.Task] = None
+    _locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
     INPUTS = {
         "img1": {
             "label": "Image 1",
@@ -155,6 +185,95 @@ class PostImageUploader(Node):
         }
     }
 
+    @classmethod
+    async def _get_browser(cls) -> Browser:
+        """Return the shared Chromium instance, launching it on first use."""
+        loop = asyncio.get_running_loop()
+        lock = cls._locks.get(loop)
+        if lock is None:
+            lock = cls._locks[loop] = asyncio.Lock()
+
+        # Serialize launches so concurrent executions cannot both start a browser
+        async with lock:
+            if cls._browser is not None and cls._loop is loop and cls._browser.is_connected():
+                return cls._browser
+
+            if cls._loop is loop:
+                # Same loop but the browser died; stopping the watcher stops the driver
+                await cls._stop_watcher()
+            elif cls._playwright is not None:
+                # The old loop went away without cancelling the watcher
+                cls._release_stale_driver(cls._playwright, cls._loop)
+            cls._browser = cls._playwright = cls._loop = cls._watcher = None
+
+            playwright = await async_playwright().start()
+            try:
+                browser = await playwright.chromium.launch(
+                    headless=True,
+                    args=["--no-sandbox", "--disable-dev-shm-usage"]
+                )
+            except BaseException:
+                await playwright.stop()
+                raise
+            cls._playwright, cls._browser, cls._loop = playwright, browser, loop
+            cls._watcher = loop.create_task(cls._close_on_loop_shutdown(browser, playwright))
+            return browser
+
+    @classmethod
+    async def _close_on_loop_shutdown(cls, browser: Browser, playwright: Playwright) -> None:
+        """Keep the browser open until its loop cancels this task on shutdown, then stop the driver."""
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if cls._browser is browser:
+                cls._browser = cls._playwright = cls._loop = cls._watcher = None
+            # No browser.close() here: asyncio.run cancels Playwright's connection task
+            # together with this one, so a round trip to the driver would never get a
+            # reply. Stopping the driver is local, and Chromium exits along with it.
+            await playwright.stop()
+
+    @classmethod
+    async def _stop_watcher(cls) -> None:
+        """Cancel the watcher task and wait for it to stop the driver."""
+        watcher = cls._watcher
+        if watcher is not None and not watcher.done():
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+
+    @staticmethod
+    def _release_stale_driver(playwright: Playwright, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Stop a Playwright driver whose loop is no longer the running one."""
+        if loop is not None and not loop.is_closed() and not loop.is_running():
+            # The old loop can still run coroutines, just not from inside this one,
+            # so drive the public stop() on it from a helper thread
+            worker = threading.Thread(target=loop.run_until_complete, args=(playwright.stop(),))
+            worker.start()
+            worker.join()
+            return
+
+        # The old loop is closed, so no public API can reach the driver any more.
+        # Kill its process directly; Chromium is attached over a pipe and exits with it.
+        transport = getattr(getattr(playwright, "_connection", None), "_transport", None)
+        proc = getattr(transport, "_proc", None)
+        if proc is None:
+            logger.warning("Could not find the stale Playwright driver process; it and its browser may leak")
+            return
+        try:
+            if proc.returncode is None:
+                proc.kill()
+        except (ProcessLookupError, RuntimeError) as e:
+            logger.warning(f"Could not kill the stale Playwright driver process: {e}")
+
+    @classmethod
+    def _shutdown(cls) -> None:
+        """Release the shared browser on interpreter shutdown."""
+        if cls._browser is None or cls._loop is None:
+            return
+        if not cls._loop.is_closed() and not cls._loop.is_running():
+            cls._loop.run_until_complete(cls._stop_watcher())
+        elif cls._playwright is not None:
+            cls._release_stale_driver(cls._playwright, cls._loop)
+
     def _get_valid_image_paths(self, node_inputs: Dict[str, str]) -> List[Tuple[int, str]]:
         """Get all valid image paths from inputs with their indices."""
         valid_images = []
@@ -174,8 +293,8 @@ class PostImageUploader(Node):
             await page.wait_for_selector('#ddupload', timeout=30000)
             
             # Find the hidden file input (it's added dynamically by their JS)
-            # Wait a bit for JS to initialize
-            await page.wait_for_timeout(2000)
+            # Wait until their JS has attached it to the DOM
+            await page.wait_for_selector('input[type="file"]', state='attached', timeout=10000)
             
             # The site creates a hidden file input, we need to make it visible to interact with it
             await page.evaluate("""() => {
@@ -201,14 +320,17 @@ class PostImageUploader(Node):
             await page.select_option('#embed_box', 'code_direct')
             
             # Wait for textarea to update with direct links
-            await page.wait_for_timeout(1000)  # Brief pause for content update
+            await page.wait_for_function(
+                "() => { const box = document.querySelector('#code_box'); return !!box && box.value.includes('i.postimg.cc'); }",
+                timeout=10000
+            )
             
             # Get the direct URLs from the textarea
             code_box = await page.wait_for_selector('#code_box')
             text_content = await code_box.input_value()
             
             # Extract all direct URLs - should be in format https://i.postimg.cc/xxx/filename.ext
-            direct_urls = re.findall(r'https://i\.postimg\.cc/\w+/[^\s\n]+', text_content)
+            direct_urls = _POSTIMG_RE.findall(text_content)
             
             if not direct_urls or len(direct_urls) != len(image_paths):
                 raise ValueError(f"Expected {len(image_paths)} URLs but found {len(direct_urls)}")
@@ -222,9 +344,8 @@ class PostImageUploader(Node):
             
             # Map URLs to their corresponding indices
             for (index, path), url in zip(image_paths, direct_urls):
-                if not url.endswith('?dl=1'):
-                    url += '?dl=1'
-                results[f"url{index}"] = url
+                # Direct links never carry the download suffix, so always append it
+                results[f"url{index}"] = url + '?dl=1'
                 workflow_logger.info(f"Successfully uploaded image {index}: {os.path.basename(path)}")
             
             return results
@@ -246,13 +367,14 @@ class PostImageUploader(Node):
             
             workflow_logger.info(f"Uploading {len(image_paths)} images to PostImage")
 
-            async with async_playwright() as playwright:
-                browser = await playwright.chromium.launch(headless=True)
-                context = await browser.new_context()
+            browser = await self._get_browser()
+            context = await browser.new_context()
+            try:
+                await context.route("**/*", _block_resources)
                 page = await context.new_page()
-
                 results = await self._upload_images(page, image_paths, workflow_logger)
-                await browser.close()
+            finally:
+                await context.close()
 
             return results
 
@@ -264,3 +386,18 @@ class PostImageUploader(Node):
                 "error_message": error_msg,
                 **{f"url{i}": "" for i in range(1, 9)}
             }
+
+
+atexit.register(PostImageUploader._shutdown)
+
+
+if __name__ == "__main__":
+    # Check that a host calling asyncio.run per execution does not hang on loop shutdown
+    logging.basicConfig(level=logging.INFO)
+    for attempt in (1, 2):
+        runner = threading.Thread(target=asyncio.run, args=(PostImageUploader._get_browser(),), daemon=True)
+        runner.start()
+        runner.join(timeout=60)
+        if runner.is_alive():
+            raise SystemExit(f"asyncio.run did not return after browser launch {attempt}")
+        print(f"Browser launch {attempt}: asyncio.run returned")